@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Report where splunk-as spends its import-time startup cost.
+
+This script:
+1. Resolves the module behind the 'splunk-as' console script
+2. Imports it under 'python -X importtime' in a fresh interpreter
+3. Reports total import time, the slowest imports, and self time per package
+4. Optionally exits with non-zero status if startup exceeds a budget
+
+Every 'splunk-as' call (including each '--help' run by validate_cli_docs.py)
+pays this cost before any command runs, so eagerly imported command groups and
+heavy dependencies show up here first.
+
+Usage:
+    python scripts/startup_profile.py
+    python scripts/startup_profile.py --top 30
+    python scripts/startup_profile.py --budget 0.5
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from importlib import metadata
+from typing import Dict, List, Optional, Tuple
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def find_entry_module(script: str = "splunk-as") -> Optional[str]:
+    """Return the module that provides a console script, if installed."""
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        candidates = eps.select(group="console_scripts", name=script)
+    else:  # Python 3.9
+        candidates = [ep for ep in eps.get("console_scripts", []) if ep.name == script]
+    for ep in candidates:
+        return ep.value.split(":")[0]
+    return None
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int, int]]:
+    """Import module in a fresh interpreter.
+
+    Returns list of (name, self_us, cumulative_us, depth) tuples.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            depth = (len(indent) - 1) // 2
+            imports.append((name, int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def self_time_by_package(imports: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """Sum self time per top-level package."""
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in imports:
+        totals[name.split(".")[0]] += self_us
+    return dict(totals)
+
+
+def main():
+    """Main profiling function."""
+    parser = argparse.ArgumentParser(
+        description="Profile splunk-as import-time startup cost"
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of slowest imports to show"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Fail if total import time exceeds this many seconds",
+    )
+    parser.add_argument(
+        "--module", help="Module to profile (default: resolved from 'splunk-as')"
+    )
+    args = parser.parse_args()
+
+    module = args.module or find_entry_module()
+    if not module:
+        print("splunk-as is not installed; install it with: pip install splunk-as")
+        sys.exit(2)
+
+    try:
+        imports = profile_imports(module)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    total_us = sum(self_us for _, self_us, _, _ in imports)
+    print(f"Import time for {module}: {total_us / 1e6:.3f}s ({len(imports)} modules)")
+    print()
+
+    print(f"Slowest imports (cumulative, top {args.top}):")
+    for name, _, cumulative_us, depth in sorted(imports, key=lambda i: -i[2])[
+        : args.top
+    ]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {'  ' * depth}{name}")
+    print()
+
+    print(f"Self time by package (top {args.top}):")
+    packages = sorted(self_time_by_package(imports).items(), key=lambda p: -p[1])
+    for package, self_us in packages[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+
+    if args.budget is not None and total_us / 1e6 > args.budget:
+        print()
+        print(f"Startup import time exceeds budget of {args.budget:.3f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,23 @@
 This script:
 1. Parses all skills/*/SKILL.md files
 2. Extracts CLI command examples (lines starting with 'splunk-as')
-3. Runs 'splunk-as <command> --help' to verify the command exists
+3. Runs 'splunk-as <command> --help' concurrently to verify each unique
+   command exists (each call pays the CLI's full startup cost)
 4. Reports any documented commands that don't exist in the CLI
 5. Exits with non-zero status if validation fails
 
 Usage:
     python scripts/validate_cli_docs.py
     python scripts/validate_cli_docs.py --verbose
+    python scripts/validate_cli_docs.py --jobs 16
 """
 
 import argparse
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Known top-level command groups from splunk-as --help
@@ -106,6 +110,13 @@ def main():
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Show all commands being validated"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Number of 'splunk-as --help' checks to run in parallel",
+    )
     args = parser.parse_args()
 
     # Find all SKILL.md files
@@ -119,14 +130,22 @@ def main():
     print(f"Found {len(skill_files)} SKILL.md files to validate")
     print()
 
+    # Extract everything first so each unique command is checked once, in parallel
+    commands_by_file = {f: extract_cli_commands(f) for f in sorted(skill_files)}
+    unique_commands = sorted(
+        {command for commands in commands_by_file.values() for command, _ in commands}
+    )
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        command_results = dict(
+            zip(unique_commands, pool.map(validate_command, unique_commands))
+        )
+
     # Track all commands and validation results
     all_errors = []
-    validated_commands = set()  # Cache to avoid re-validating same commands
-    command_results = {}  # Cache validation results
+    validated_commands = set()  # Commands already reported
 
-    for skill_file in sorted(skill_files):
+    for skill_file, commands in commands_by_file.items():
         skill_name = skill_file.parent.name
-        commands = extract_cli_commands(skill_file)
 
         if not commands:
             continue
@@ -143,8 +162,7 @@ def main():
                 continue
 
             validated_commands.add(command)
-            is_valid = validate_command(command)
-            command_results[command] = is_valid
+            is_valid = command_results[command]
 
             if not is_valid:
                 all_errors.append((skill_file, command, line_num))
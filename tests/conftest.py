@@ -0,0 +1,19 @@
+"""Shared pytest fixtures backed by the fake splunkd server."""
+
+import pytest
+from fake_splunkd import FakeSplunkd
+
+
+@pytest.fixture
+def fake_splunkd():
+    """Start a fake splunkd with defaults; tune via fake_splunkd.state."""
+    with FakeSplunkd() as server:
+        yield server
+
+
+@pytest.fixture
+def fake_splunkd_env(fake_splunkd, monkeypatch):
+    """Point splunk-as at the fake server through SPLUNK_* variables."""
+    for name, value in fake_splunkd.env().items():
+        monkeypatch.setenv(name, value)
+    return fake_splunkd
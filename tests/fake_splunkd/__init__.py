@@ -0,0 +1,17 @@
+"""Fake splunkd REST server for offline testing and benchmarks."""
+
+from .server import (
+    MAX_DOCUMENTS_PER_BATCH_SAVE,
+    MAX_RESULT_ROWS,
+    FakeSplunkd,
+    synthetic_row,
+    time_window,
+)
+
+__all__ = [
+    "MAX_DOCUMENTS_PER_BATCH_SAVE",
+    "MAX_RESULT_ROWS",
+    "FakeSplunkd",
+    "synthetic_row",
+    "time_window",
+]
@@ -0,0 +1,890 @@
+#!/usr/bin/env python3
+"""
+Fake splunkd management API for offline testing.
+
+Serves the subset of the Splunk REST API used by the splunk-as CLI, backed by
+deterministic synthetic data of configurable size and latency. Uses only the
+standard library so it runs anywhere Python does.
+
+Synthetic events are one second apart, newest first, ending at BASE_EPOCH.
+Searches honor epoch `earliest_time`/`latest_time` bounds; relative modifiers
+such as `-1h` or `now` select every row.
+
+Lookups are modelled the way splunk-as uses them: `lookup upload` runs a
+oneshot `makeresults ... | outputlookup` search whose rows are stored, and
+`lookup get`/`download` read them back with `| inputlookup`. A oneshot
+`| metadata type=hosts|sourcetypes` summarizes the synthetic events.
+
+Usage:
+    python tests/fake_splunkd/server.py --port 8089 --rows 100000
+    python tests/fake_splunkd/server.py --latency 0.05 --job-duration 2
+"""
+
+import argparse
+import csv
+import fnmatch
+import io
+import itertools
+import json
+import math
+import re
+import shlex
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Documents accepted per batch_save request (limits.conf [kvstore] default)
+MAX_DOCUMENTS_PER_BATCH_SAVE = 1000
+
+# Rows returned per results request when count is 0 (limits.conf default)
+MAX_RESULT_ROWS = 50000
+
+BASE_EPOCH = 1704067200  # 2024-01-01T00:00:00Z
+
+FIELDS = ["_time", "host", "sourcetype", "status", "uri", "bytes", "_raw"]
+
+
+@dataclass
+class FakeJob:
+    """State of a search job on the fake server."""
+
+    sid: str
+    search: str
+    created: float
+    earliest_time: str = ""
+    latest_time: str = ""
+    cancelled: bool = False
+    paused: bool = False
+    ttl: int = 600
+    owner: str = "admin"
+    app: str = "search"
+    label: str = ""
+
+    def progress(self, duration: float) -> float:
+        if duration <= 0:
+            return 1.0
+        return min(1.0, (time.time() - self.created) / duration)
+
+
+@dataclass
+class FakeSplunkdState:
+    """Server-side state shared by all request handlers."""
+
+    rows: int = 1000
+    latency: float = 0.0
+    job_duration: float = 0.0
+    stream_chunk_rows: int = 1000
+    stream_delay: float = 0.0
+    token: Optional[str] = None
+    jobs: Dict[str, FakeJob] = field(default_factory=dict)
+    collections: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+    lookups: Dict[str, bytes] = field(default_factory=dict)
+    requests: List[Tuple[str, str]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    sid_counter: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+
+    def next_sid(self) -> str:
+        """Return a new SID in Splunk's `<epoch>.<n>` form."""
+        with self.lock:
+            return f"{int(time.time())}.{next(self.sid_counter)}"
+
+    def record(self, method: str, path: str):
+        with self.lock:
+            self.requests.append((method, path))
+
+    def request_count(self, method: Optional[str] = None, prefix: str = "") -> int:
+        """Count recorded requests, optionally filtered by method and path prefix."""
+        with self.lock:
+            return sum(
+                1
+                for m, p in self.requests
+                if (method is None or m == method) and p.startswith(prefix)
+            )
+
+
+def synthetic_row(i: int) -> Dict[str, str]:
+    """Build the i-th synthetic event; rows are newest-first like Splunk."""
+    host = f"web{i % 10:02d}"
+    status = ("200", "200", "200", "301", "404", "500")[i % 6]
+    uri = f"/app/page/{i % 97}"
+    size = str(200 + (i * 37) % 5000)
+    ts = BASE_EPOCH - i
+    return {
+        "_time": str(ts),
+        "host": host,
+        "sourcetype": "access_combined",
+        "status": status,
+        "uri": uri,
+        "bytes": size,
+        "_raw": f'{ts} {host} "GET {uri} HTTP/1.1" {status} {size}',
+    }
+
+
+def time_window(rows: int, earliest: str, latest: str) -> Tuple[int, int]:
+    """Return the row index range whose _time falls in [earliest, latest)."""
+    first, end = 0, rows
+    if _is_epoch(latest):
+        first = max(first, BASE_EPOCH - math.ceil(float(latest)) + 1)
+    if _is_epoch(earliest):
+        end = min(end, BASE_EPOCH - math.ceil(float(earliest)) + 1)
+    return first, max(first, end)
+
+
+def _is_epoch(value: Optional[str]) -> bool:
+    return bool(value) and re.fullmatch(r"\d+(\.\d+)?", value) is not None
+
+
+def _normalize_path(path: str) -> str:
+    """Map /servicesNS/{owner}/{app}/... and /services/... onto one form."""
+    path = re.sub(r"^/servicesNS/[^/]+/[^/]+", "/services", path)
+    path = path.replace("/search/v2/jobs", "/search/jobs")
+    return path.rstrip("/") or "/"
+
+
+class FakeSplunkdHandler(BaseHTTPRequestHandler):
+    """Routes requests to the fake endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    server: "FakeSplunkd"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> FakeSplunkdState:
+        return self.server.state
+
+    # Request plumbing
+
+    def _parse(self) -> Tuple[str, Dict[str, str], bytes]:
+        parsed = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type", "")
+        if body and "application/x-www-form-urlencoded" in content_type:
+            for k, v in parse_qs(body.decode()).items():
+                params[k] = v[-1]
+        return _normalize_path(parsed.path), params, body
+
+    def _send(self, status: int, payload: Any, content_type: str = "application/json"):
+        if isinstance(payload, (dict, list)):
+            data = json.dumps(payload).encode()
+        elif isinstance(payload, str):
+            data = payload.encode()
+        else:
+            data = payload
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, text: str):
+        self._send(status, {"messages": [{"type": "ERROR", "text": text}]})
+
+    def _authorized(self) -> bool:
+        if self.state.token is None:
+            return True
+        return self.headers.get("Authorization") == f"Bearer {self.state.token}"
+
+    def _dispatch(self, method: str):
+        path, params, body = self._parse()
+        self.state.record(method, path)
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        if not self._authorized():
+            self._error(401, "call not properly authenticated")
+            return
+        for pattern, route_method, handler in ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                try:
+                    handler(self, params, body, *match.groups())
+                except ValueError as e:
+                    # Includes json.JSONDecodeError and bad int() parameters
+                    self._error(400, f"Invalid request: {e}")
+                return
+        self._error(404, f"Unknown endpoint: {method} {path}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    # Result rendering
+
+    def _window(self, earliest: str, latest: str) -> Tuple[int, int]:
+        return time_window(self.state.rows, earliest, latest)
+
+    def _rows(
+        self, offset: int, count: int, window: Tuple[int, int]
+    ) -> List[Dict[str, str]]:
+        first, end = window
+        start = first + offset
+        if count > 0:
+            end = min(end, start + count)
+        return [synthetic_row(i) for i in range(start, end)]
+
+    def _send_results(self, params: Dict[str, str], rows: List[Dict[str, str]]):
+        fields = _field_list(params)
+        self._send_table(params, fields, [{k: r[k] for k in fields} for r in rows])
+
+    def _send_table(
+        self, params: Dict[str, str], fields: List[str], rows: List[Dict[str, str]]
+    ):
+        if params.get("output_mode") == "csv":
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
+            self._send(200, buf.getvalue(), "text/csv")
+            return
+        self._send(
+            200,
+            {
+                "preview": False,
+                "init_offset": int(params.get("offset", 0)),
+                "fields": [{"name": f} for f in fields],
+                "results": rows,
+            },
+        )
+
+    # Server info
+
+    def server_info(self, params, body):
+        self._send(
+            200,
+            {
+                "entry": [
+                    {
+                        "name": "server-info",
+                        "content": {
+                            "serverName": "fake-splunkd",
+                            "version": "9.1.0",
+                            "build": "fake",
+                            "os_name": "Linux",
+                        },
+                    }
+                ]
+            },
+        )
+
+    # Search jobs
+
+    def oneshot(self, params, body):
+        search = params.get("search", "")
+        output = _OUTPUTLOOKUP.search(search)
+        if output:
+            self._output_lookup(params, search, output.group(1))
+            return
+        inputlookup = _INPUTLOOKUP.fullmatch(search)
+        if inputlookup:
+            self._input_lookup(params, *inputlookup.groups())
+            return
+        metadata = _METADATA.fullmatch(search)
+        if metadata:
+            self._metadata(params, _METADATA_FIELDS[metadata.group(1)])
+            return
+        count = int(params.get("count", 100))
+        window = self._window(
+            params.get("earliest_time", ""), params.get("latest_time", "")
+        )
+        self._send_results(
+            params, self._rows(int(params.get("offset", 0)), count, window)
+        )
+
+    def _metadata(self, params, name):
+        """Summarize events by one field the way `| metadata` does."""
+        window = self._window(
+            params.get("earliest_time", ""), params.get("latest_time", "")
+        )
+        summary: Dict[str, Dict[str, int]] = {}
+        for row in self._rows(0, 0, window):
+            t = int(row["_time"])
+            entry = summary.setdefault(
+                row[name], {"firstTime": t, "lastTime": t, "totalCount": 0}
+            )
+            entry["firstTime"] = min(entry["firstTime"], t)
+            entry["lastTime"] = max(entry["lastTime"], t)
+            entry["totalCount"] += 1
+        rows = [
+            {name: value, **{k: str(v) for k, v in entry.items()}}
+            for value, entry in sorted(summary.items())
+        ]
+        count = int(params.get("count", 100))
+        if count > 0:
+            rows = rows[:count]
+        fields = [name, "firstTime", "lastTime", "totalCount"]
+        self._send_table(params, fields, rows)
+
+    def create_job(self, params, body):
+        if not params.get("search"):
+            self._error(400, "Missing search parameter")
+            return
+        if params.get("exec_mode") == "oneshot":
+            self.oneshot(params, body)
+            return
+        job = FakeJob(
+            sid=self.state.next_sid(),
+            search=params["search"],
+            created=time.time(),
+            earliest_time=params.get("earliest_time", ""),
+            latest_time=params.get("latest_time", ""),
+        )
+        with self.state.lock:
+            self.state.jobs[job.sid] = job
+        if params.get("exec_mode") == "blocking" and self.state.job_duration:
+            time.sleep(self.state.job_duration)
+        self._send(201, {"sid": job.sid})
+
+    def _job_entry(self, job: FakeJob) -> Dict[str, Any]:
+        progress = job.progress(self.state.job_duration)
+        first, end = self._window(job.earliest_time, job.latest_time)
+        total = end - first
+        if job.cancelled:
+            state = "FAILED"
+        elif job.paused:
+            state = "PAUSED"
+        elif progress >= 1.0:
+            state = "DONE"
+        else:
+            state = "RUNNING"
+        published = datetime.fromtimestamp(job.created, timezone.utc)
+        return {
+            "name": job.search,
+            "published": published.isoformat(timespec="milliseconds"),
+            "author": job.owner,
+            "acl": {"owner": job.owner, "app": job.app},
+            "content": {
+                "sid": job.sid,
+                "label": job.label,
+                "dispatchState": state,
+                "doneProgress": progress,
+                "eventCount": int(total * progress),
+                "resultCount": int(total * progress),
+                "scanCount": int(total * progress),
+                "runDuration": time.time() - job.created,
+                "isDone": state == "DONE",
+                "isFailed": state == "FAILED",
+                "isPaused": job.paused,
+                "ttl": job.ttl,
+                "request": {
+                    "search": job.search,
+                    "earliest_time": job.earliest_time,
+                    "latest_time": job.latest_time,
+                },
+            },
+        }
+
+    def _job(self, sid: str) -> Optional[FakeJob]:
+        job = self.state.jobs.get(sid)
+        if job is None:
+            self._error(404, f"Unknown sid: {sid}")
+        return job
+
+    def list_jobs(self, params, body):
+        """List jobs newest first, honoring the `search` filter and paging."""
+        with self.state.lock:
+            jobs = sorted(self.state.jobs.values(), key=lambda j: -j.created)
+        if params.get("sort_dir") == "asc":
+            jobs.reverse()
+        entries = [self._job_entry(j) for j in jobs]
+        if params.get("search"):
+            terms = shlex.split(params["search"])
+            entries = [e for e in entries if _matches_filter(e, terms)]
+        offset = int(params.get("offset", 0))
+        count = int(params.get("count", 30))
+        page = entries[offset:] if count <= 0 else entries[offset : offset + count]
+        self._send(
+            200,
+            {
+                "paging": {"total": len(entries), "perPage": count, "offset": offset},
+                "entry": page,
+            },
+        )
+
+    def job_status(self, params, body, sid):
+        job = self._job(sid)
+        if job:
+            self._send(200, {"entry": [self._job_entry(job)]})
+
+    def job_results(self, params, body, sid, _kind):
+        job = self._job(sid)
+        if not job:
+            return
+        if job.progress(self.state.job_duration) < 1.0:
+            self._send(204, b"")
+            return
+        count = int(params.get("count", 100))
+        if count <= 0 or count > MAX_RESULT_ROWS:
+            count = MAX_RESULT_ROWS
+        window = self._window(job.earliest_time, job.latest_time)
+        self._send_results(
+            params, self._rows(int(params.get("offset", 0)), count, window)
+        )
+
+    def job_control(self, params, body, sid):
+        job = self._job(sid)
+        if not job:
+            return
+        action = params.get("action")
+        if action == "cancel":
+            job.cancelled = True
+        elif action == "pause":
+            job.paused = True
+        elif action == "unpause":
+            job.paused = False
+        elif action == "finalize":
+            job.created = 0.0
+        elif action in ("touch", "setttl"):
+            job.ttl = int(params.get("ttl", job.ttl))
+        else:
+            self._error(400, f"Unknown action: {action}")
+            return
+        self._send(200, {"messages": [{"type": "INFO", "text": f"{action} done"}]})
+
+    def delete_job(self, params, body, sid):
+        with self.state.lock:
+            job = self.state.jobs.pop(sid, None)
+        if job is None:
+            self._error(404, f"Unknown sid: {sid}")
+            return
+        self._send(
+            200, {"messages": [{"type": "INFO", "text": "Search job cancelled."}]}
+        )
+
+    def export(self, params, body):
+        """Stream results with chunked transfer encoding, one chunk per batch."""
+        count = int(params.get("count", 0))
+        first, end = self._window(
+            params.get("earliest_time", ""), params.get("latest_time", "")
+        )
+        if count > 0:
+            end = min(end, first + count)
+        fields = _field_list(params)
+        csv_mode = params.get("output_mode") == "csv"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv" if csv_mode else "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in _export_chunks(
+            first, end, fields, csv_mode, self.state.stream_chunk_rows
+        ):
+            self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+            if self.state.stream_delay:
+                time.sleep(self.state.stream_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    # KV store
+
+    def list_collections(self, params, body):
+        with self.state.lock:
+            names = sorted(self.state.collections)
+        self._send(200, {"entry": [{"name": n, "content": {}} for n in names]})
+
+    def create_collection(self, params, body):
+        name = params.get("name")
+        if not name:
+            self._error(400, "Missing name")
+            return
+        with self.state.lock:
+            if name in self.state.collections:
+                self._error(409, f"Collection exists: {name}")
+                return
+            self.state.collections[name] = {}
+        self._send(201, {"entry": [{"name": name, "content": {}}]})
+
+    def delete_collection(self, params, body, name):
+        with self.state.lock:
+            existed = self.state.collections.pop(name, None) is not None
+        if not existed:
+            self._error(404, f"Unknown collection: {name}")
+            return
+        self._send(200, {})
+
+    def _collection(self, name: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        coll = self.state.collections.get(name)
+        if coll is None:
+            self._error(404, f"Unknown collection: {name}")
+        return coll
+
+    def query_records(self, params, body, name):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        query = json.loads(params.get("query") or "{}")
+        with self.state.lock:
+            records = [
+                r for r in coll.values() if all(r.get(k) == v for k, v in query.items())
+            ]
+        offset = int(params.get("skip", 0))
+        limit = int(params.get("limit", 0))
+        self._send(
+            200, records[offset:] if limit <= 0 else records[offset : offset + limit]
+        )
+
+    def insert_record(self, params, body, name):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        record = json.loads(body or b"{}")
+        key = record.setdefault("_key", uuid.uuid4().hex)
+        with self.state.lock:
+            coll[key] = record
+        self._send(201, {"_key": key})
+
+    def batch_save(self, params, body, name):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        records = json.loads(body or b"[]")
+        if len(records) > MAX_DOCUMENTS_PER_BATCH_SAVE:
+            self._error(
+                400,
+                f"Request exceeds max_documents_per_batch_save "
+                f"({MAX_DOCUMENTS_PER_BATCH_SAVE})",
+            )
+            return
+        keys = []
+        with self.state.lock:
+            for record in records:
+                key = record.setdefault("_key", uuid.uuid4().hex)
+                coll[key] = record
+                keys.append(key)
+        self._send(200, keys)
+
+    def get_record(self, params, body, name, key):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        if key not in coll:
+            self._error(404, f"Unknown key: {key}")
+            return
+        self._send(200, coll[key])
+
+    def update_record(self, params, body, name, key):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        record = json.loads(body or b"{}")
+        record["_key"] = key
+        with self.state.lock:
+            coll[key] = record
+        self._send(200, {"_key": key})
+
+    def delete_record(self, params, body, name, key):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        with self.state.lock:
+            existed = coll.pop(key, None) is not None
+        if not existed:
+            self._error(404, f"Unknown key: {key}")
+            return
+        self._send(200, {})
+
+    def truncate_collection(self, params, body, name):
+        coll = self._collection(name)
+        if coll is None:
+            return
+        with self.state.lock:
+            coll.clear()
+        self._send(200, {})
+
+    # Lookups
+
+    def list_lookups(self, params, body):
+        with self.state.lock:
+            lookups = dict(self.state.lookups)
+        self._send(
+            200,
+            {
+                "entry": [
+                    {"name": n, "content": {"size": len(data)}}
+                    for n, data in sorted(lookups.items())
+                ]
+            },
+        )
+
+    def upload_lookup(self, params, body):
+        name = params.get("name")
+        if not name:
+            self._error(400, "Missing name")
+            return
+        data = params["eai:data"].encode() if "eai:data" in params else body
+        with self.state.lock:
+            self.state.lookups[name] = data
+        self._send(201, {"entry": [{"name": name, "content": {"size": len(data)}}]})
+
+    def _output_lookup(self, params, search, name):
+        """Store the rows of a `makeresults | eval ... | outputlookup` search."""
+        rows = [
+            {k: _unescape_spl(v) for k, v in _EVAL_PAIR.findall(evals)}
+            for evals in _MAKERESULTS_ROW.findall(search)
+        ]
+        if not rows:
+            self._error(400, f"No rows to write to lookup: {name}")
+            return
+        fields = list(rows[0])
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        with self.state.lock:
+            self.state.lookups[name] = buf.getvalue().encode()
+        self._send_table(params, fields, rows)
+
+    def _input_lookup(self, params, name, head):
+        data = self.state.lookups.get(name)
+        if data is None:
+            self._error(400, f"The lookup table '{name}' does not exist")
+            return
+        reader = csv.DictReader(io.StringIO(data.decode()))
+        rows = list(reader)
+        limit = int(head) if head else int(params.get("count", 100))
+        if limit > 0:
+            rows = rows[:limit]
+        self._send_table(params, list(reader.fieldnames or []), rows)
+
+    def get_lookup(self, params, body, name):
+        data = self.state.lookups.get(name)
+        if data is None:
+            self._error(404, f"Unknown lookup: {name}")
+            return
+        self._send(200, data, "text/csv")
+
+    def delete_lookup(self, params, body, name):
+        with self.state.lock:
+            existed = self.state.lookups.pop(name, None) is not None
+        if not existed:
+            self._error(404, f"Unknown lookup: {name}")
+            return
+        self._send(200, {})
+
+
+_OUTPUTLOOKUP = re.compile(r'\|\s*outputlookup\s+"?([^"\s|]+)"?\s*$')
+_INPUTLOOKUP = re.compile(
+    r'\s*\|\s*inputlookup\s+"?([^"\s|]+)"?(?:\s*\|\s*head\s+(\d+))?\s*'
+)
+_METADATA = re.compile(
+    r"\s*\|\s*metadata\s+type=(hosts|sourcetypes)(?:\s+index=\S+)?\s*"
+)
+_METADATA_FIELDS = {"hosts": "host", "sourcetypes": "sourcetype"}
+_MAKERESULTS_ROW = re.compile(
+    r'makeresults \| eval ((?:\w+="(?:[^"\\]|\\.)*"(?:, )?)+)'
+)
+_EVAL_PAIR = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _matches_filter(entry: Dict[str, Any], terms: List[str]) -> bool:
+    """Match a REST `search=` filter of `field=pattern` terms against an entry."""
+    for term in terms:
+        key, _, pattern = term.partition("=")
+        if key.startswith("eai:acl."):
+            value = entry["acl"].get(key[len("eai:acl.") :])
+        else:
+            value = entry["content"].get(key)
+        if value is None or not fnmatch.fnmatchcase(str(value), pattern):
+            return False
+    return True
+
+
+def _unescape_spl(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _field_list(params: Dict[str, str]) -> List[str]:
+    requested = params.get("field_list") or params.get("f")
+    if not requested:
+        return FIELDS
+    return [f for f in requested.split(",") if f in FIELDS] or FIELDS
+
+
+def _export_chunks(
+    first: int, end: int, fields: List[str], csv_mode: bool, chunk_rows: int
+) -> Iterator[bytes]:
+    """Yield export output for rows [first, end) in batches of chunk_rows rows."""
+    chunk_rows = max(1, chunk_rows)
+    for start in range(first, max(end, first + 1), chunk_rows):
+        stop = min(end, start + chunk_rows)
+        buf = io.StringIO()
+        if csv_mode:
+            writer = csv.DictWriter(buf, fieldnames=fields, lineterminator="\n")
+            if start == first:
+                writer.writeheader()
+            for i in range(start, stop):
+                row = synthetic_row(i)
+                writer.writerow({k: row[k] for k in fields})
+        else:
+            for i in range(start, stop):
+                row = synthetic_row(i)
+                event = {"preview": False, "offset": i - first}
+                if i == end - 1:
+                    event["lastrow"] = True
+                event["result"] = {k: row[k] for k in fields}
+                buf.write(json.dumps(event) + "\n")
+        if buf.tell():
+            yield buf.getvalue().encode()
+
+
+H = FakeSplunkdHandler
+JOB = r"/services/search/jobs/([^/]+)"
+COLL = r"/services/storage/collections/data/([^/]+)"
+LOOKUP = r"/services/data/lookup-table-files"
+
+ROUTES = [
+    (r"/services/server/info", "GET", H.server_info),
+    (r"/services/search/jobs/oneshot", "POST", H.oneshot),
+    (r"/services/search/jobs/export", "GET", H.export),
+    (r"/services/search/jobs/export", "POST", H.export),
+    (r"/services/search/jobs", "GET", H.list_jobs),
+    (r"/services/search/jobs", "POST", H.create_job),
+    (JOB + r"/(results|results_preview|events)", "GET", H.job_results),
+    (JOB + r"/control", "POST", H.job_control),
+    (JOB, "GET", H.job_status),
+    (JOB, "DELETE", H.delete_job),
+    (r"/services/storage/collections/config", "GET", H.list_collections),
+    (r"/services/storage/collections/config", "POST", H.create_collection),
+    (r"/services/storage/collections/config/([^/]+)", "DELETE", H.delete_collection),
+    (COLL + r"/batch_save", "POST", H.batch_save),
+    (COLL, "GET", H.query_records),
+    (COLL, "POST", H.insert_record),
+    (COLL, "DELETE", H.truncate_collection),
+    (COLL + r"/([^/]+)", "GET", H.get_record),
+    (COLL + r"/([^/]+)", "POST", H.update_record),
+    (COLL + r"/([^/]+)", "PUT", H.update_record),
+    (COLL + r"/([^/]+)", "DELETE", H.delete_record),
+    (LOOKUP, "GET", H.list_lookups),
+    (LOOKUP, "POST", H.upload_lookup),
+    (LOOKUP + r"/([^/]+)", "GET", H.get_lookup),
+    (LOOKUP + r"/([^/]+)", "DELETE", H.delete_lookup),
+]
+
+
+class FakeSplunkd(ThreadingHTTPServer):
+    """Threaded HTTP server speaking a subset of the splunkd REST API."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rows: int = 1000,
+        latency: float = 0.0,
+        job_duration: float = 0.0,
+        stream_chunk_rows: int = 1000,
+        stream_delay: float = 0.0,
+        token: Optional[str] = None,
+    ):
+        super().__init__((host, port), FakeSplunkdHandler)
+        self.state = FakeSplunkdState(
+            rows=rows,
+            latency=latency,
+            job_duration=job_duration,
+            stream_chunk_rows=stream_chunk_rows,
+            stream_delay=stream_delay,
+            token=token,
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def env(self) -> Dict[str, str]:
+        """SPLUNK_* variables that point splunk-as at this server."""
+        return {
+            "SPLUNK_SITE_URL": f"http://{self.server_address[0]}",
+            "SPLUNK_MANAGEMENT_PORT": str(self.port),
+            "SPLUNK_TOKEN": self.state.token or "fake-token",
+            "SPLUNK_VERIFY_SSL": "false",
+        }
+
+    def start(self) -> "FakeSplunkd":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading an export stream early are expected
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+    def __enter__(self) -> "FakeSplunkd":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description="Fake splunkd REST API server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8089, help="Listen port")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per search")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every request"
+    )
+    parser.add_argument(
+        "--job-duration", type=float, default=0.0, help="Seconds until jobs are DONE"
+    )
+    parser.add_argument(
+        "--stream-chunk-rows", type=int, default=1000, help="Rows per export chunk"
+    )
+    parser.add_argument(
+        "--stream-delay", type=float, default=0.0, help="Seconds between export chunks"
+    )
+    parser.add_argument("--token", help="Require this Bearer token")
+    args = parser.parse_args()
+
+    server = FakeSplunkd(
+        host=args.host,
+        port=args.port,
+        rows=args.rows,
+        latency=args.latency,
+        job_duration=args.job_duration,
+        stream_chunk_rows=args.stream_chunk_rows,
+        stream_delay=args.stream_delay,
+        token=args.token,
+    )
+    print(f"Fake splunkd listening on {server.url} ({args.rows} rows per search)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
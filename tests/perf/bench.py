@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for documented splunk-as command paths.
+
+Runs the real splunk-as CLI against the fake splunkd server and measures:
+1. Cold CLI startup (`splunk-as --help`)
+2. `search oneshot` latency
+3. `export stream` throughput in rows/s and MB/s
+4. `job poll` completion detection latency
+5. `kvstore batch-insert` throughput in docs/s, loaded in server-sized chunks
+
+Results can be saved as the baseline or compared against it; a comparison
+fails when any metric regresses by more than the threshold or exceeds its
+absolute budget in budgets.json (such as the cold-start budget).
+
+Usage:
+    python tests/perf/bench.py
+    python tests/perf/bench.py --save-baseline
+    python tests/perf/bench.py --compare --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.parse
+import urllib.request
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fake_splunkd import MAX_DOCUMENTS_PER_BATCH_SAVE, FakeSplunkd  # noqa: E402
+
+PERF_DIR = Path(__file__).parent
+BASELINE_PATH = PERF_DIR / "baseline.json"
+BUDGETS_PATH = PERF_DIR / "budgets.json"
+
+DEFAULT_THRESHOLD = 0.20
+
+
+@dataclass
+class Metric:
+    """A single benchmark measurement."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+
+def run_cli(args: List[str], env: Dict[str, str], timeout: int = 300) -> float:
+    """Run splunk-as with args and return its wall-clock time in seconds."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        ["splunk-as"] + args, capture_output=True, text=True, env=env, timeout=timeout
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"splunk-as {' '.join(args)} failed ({result.returncode}): "
+            f"{result.stderr.strip() or result.stdout.strip()}"
+        )
+    return elapsed
+
+
+def _post(server: FakeSplunkd, path: str, data: Dict[str, str]) -> dict:
+    body = urllib.parse.urlencode(data).encode()
+    with urllib.request.urlopen(server.url + path, data=body, timeout=10) as resp:
+        return json.loads(resp.read())
+
+
+def bench_startup(env: Dict[str, str], repeat: int) -> Metric:
+    times = [run_cli(["--help"], env) for _ in range(repeat)]
+    return Metric("cli_startup", min(times), "s")
+
+
+def bench_oneshot(server: FakeSplunkd, env: Dict[str, str], repeat: int) -> Metric:
+    server.state.rows = 1000
+    args = ["search", "oneshot", "index=main | head 100", "-c", "100", "-o", "json"]
+    times = [run_cli(args, env) for _ in range(repeat)]
+    return Metric("search_oneshot", min(times), "s")
+
+
+def bench_export(
+    server: FakeSplunkd, env: Dict[str, str], workdir: Path, rows: int, repeat: int
+) -> List[Metric]:
+    server.state.rows = rows
+    output = workdir / "export.csv"
+    args = ["export", "stream", "index=main", "-o", str(output), "-f", "csv"]
+    elapsed = min(run_cli(args, env) for _ in range(repeat))
+    with open(output, "rb") as f:
+        exported = sum(1 for _ in f) - 1
+    if exported != rows:
+        raise RuntimeError(f"export stream wrote {exported} rows, expected {rows}")
+    size_mb = output.stat().st_size / 1_000_000
+    return [
+        Metric("export_stream_rows", rows / elapsed, "rows/s", higher_is_better=True),
+        Metric("export_stream_mb", size_mb / elapsed, "MB/s", higher_is_better=True),
+    ]
+
+
+def bench_job_poll(server: FakeSplunkd, env: Dict[str, str]) -> Metric:
+    """Time from a job reaching DONE until `job poll` returns."""
+    server.state.job_duration = 2.0
+    created = time.perf_counter()
+    sid = _post(server, "/services/search/v2/jobs", {"search": "index=main"})["sid"]
+    run_cli(["job", "poll", sid, "--timeout", "60"], env)
+    detected = time.perf_counter() - created - server.state.job_duration
+    server.state.job_duration = 0.0
+    return Metric("job_poll_detection", max(detected, 0.0), "s")
+
+
+def bench_kvstore(
+    server: FakeSplunkd, env: Dict[str, str], workdir: Path, docs: int
+) -> Metric:
+    """Load docs the documented way: one batch-insert per server-sized chunk."""
+    collection = "perf_bench"
+    server.state.collections.pop(collection, None)
+    _post(server, "/services/storage/collections/config", {"name": collection})
+    records = [{"_key": str(i), "host": f"web{i % 10}"} for i in range(docs)]
+    chunks = []
+    for start in range(0, docs, MAX_DOCUMENTS_PER_BATCH_SAVE):
+        chunk = workdir / f"records_{start:08d}.json"
+        chunk.write_text(
+            json.dumps(records[start : start + MAX_DOCUMENTS_PER_BATCH_SAVE])
+        )
+        chunks.append(chunk)
+    elapsed = sum(
+        run_cli(["kvstore", "batch-insert", collection, str(c), "--app", "search"], env)
+        for c in chunks
+    )
+    stored = len(server.state.collections[collection])
+    if stored != docs:
+        raise RuntimeError(
+            f"kvstore batch-insert stored {stored} docs, expected {docs}"
+        )
+    return Metric(
+        "kvstore_batch_insert", docs / elapsed, "docs/s", higher_is_better=True
+    )
+
+
+def run_benchmarks(
+    repeat: int = 3, export_rows: int = 200_000, kvstore_docs: int = 10_000
+) -> List[Metric]:
+    """Run every benchmark against a fresh fake splunkd server."""
+    if shutil.which("splunk-as") is None:
+        raise RuntimeError(
+            "splunk-as not found; install it with: pip install splunk-as"
+        )
+
+    metrics = []
+    with FakeSplunkd() as server, tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, **server.env()}
+        workdir = Path(tmp)
+        metrics.append(bench_startup(env, repeat))
+        metrics.append(bench_oneshot(server, env, repeat))
+        metrics.extend(bench_export(server, env, workdir, export_rows, repeat))
+        metrics.append(bench_job_poll(server, env))
+        metrics.append(bench_kvstore(server, env, workdir, kvstore_docs))
+    return metrics
+
+
+def compare(
+    metrics: List[Metric], baseline: Dict[str, dict], threshold: float
+) -> List[str]:
+    """Return a description of every metric that regressed beyond threshold."""
+    regressions = []
+    for metric in metrics:
+        base = baseline.get(metric.name)
+        if not base:
+            continue
+        expected = base["value"]
+        if metric.higher_is_better:
+            regressed = metric.value < expected * (1 - threshold)
+        else:
+            regressed = metric.value > expected * (1 + threshold)
+        if regressed:
+            regressions.append(
+                f"{metric.name}: {metric.value:.4g} {metric.unit} "
+                f"vs baseline {expected:.4g} {metric.unit}"
+            )
+    return regressions
+
+
+def check_budgets(metrics: List[Metric], budgets: Dict[str, dict]) -> List[str]:
+    """Return a description of every metric above its absolute budget."""
+    violations = []
+    for metric in metrics:
+        budget = budgets.get(metric.name)
+        if budget and metric.value > budget["max"]:
+            violations.append(
+                f"{metric.name}: {metric.value:.4g} {metric.unit} "
+                f"exceeds budget {budget['max']:.4g} {budget['unit']}"
+            )
+    return violations
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> Dict[str, dict]:
+    """Load absolute per-metric budgets keyed by name."""
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, dict]]:
+    """Load baseline metrics keyed by name, or None if no baseline exists."""
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())["metrics"]
+
+
+def save_baseline(metrics: List[Metric], path: Path = BASELINE_PATH):
+    """Write metrics as the new baseline."""
+    data = {
+        "timestamp": datetime.now().isoformat(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "python": platform.python_version(),
+        "metrics": {m.name: asdict(m) for m in metrics},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def print_metrics(metrics: List[Metric], baseline: Optional[Dict[str, dict]]):
+    print(f"{'Metric':<24} {'Value':>12}  {'Unit':<8} {'Baseline':>12}")
+    print("-" * 60)
+    for m in metrics:
+        base = (baseline or {}).get(m.name)
+        base_text = f"{base['value']:.4g}" if base else "-"
+        print(f"{m.name:<24} {m.value:>12.4g}  {m.unit:<8} {base_text:>12}")
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description="Benchmark splunk-as command paths")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store results as the baseline"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="Fail on regressions from the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed regression as a fraction (default: 0.20)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per latency and export benchmark (min is kept)",
+    )
+    parser.add_argument("--export-rows", type=int, default=200_000)
+    parser.add_argument("--kvstore-docs", type=int, default=10_000)
+    parser.add_argument("-o", "--output", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        metrics = run_benchmarks(args.repeat, args.export_rows, args.kvstore_docs)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    baseline = load_baseline()
+    print_metrics(metrics, baseline)
+
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps([asdict(m) for m in metrics], indent=2) + "\n"
+        )
+
+    if args.save_baseline:
+        save_baseline(metrics)
+        print(f"\nBaseline written to {BASELINE_PATH}")
+
+    if args.compare:
+        violations = check_budgets(metrics, load_budgets())
+        if violations:
+            print("\nBUDGET EXCEEDED:")
+            for line in violations:
+                print(f"  {line}")
+            sys.exit(1)
+        if baseline is None:
+            print(f"\nNo baseline at {BASELINE_PATH}; run with --save-baseline first")
+            sys.exit(2)
+        regressions = compare(metrics, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS (>{args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark regression gate and comparison logic."""
+
+import os
+import shutil
+
+import pytest
+
+from .bench import (
+    DEFAULT_THRESHOLD,
+    Metric,
+    bench_startup,
+    check_budgets,
+    compare,
+    load_baseline,
+    load_budgets,
+    run_benchmarks,
+)
+
+BASELINE = {
+    "cli_startup": {"value": 0.5, "unit": "s", "higher_is_better": False},
+    "export_stream_rows": {
+        "value": 100_000,
+        "unit": "rows/s",
+        "higher_is_better": True,
+    },
+}
+
+
+def test_compare_within_threshold():
+    metrics = [
+        Metric("cli_startup", 0.55, "s"),
+        Metric("export_stream_rows", 90_000, "rows/s", higher_is_better=True),
+    ]
+    assert compare(metrics, BASELINE, 0.2) == []
+
+
+def test_compare_flags_slower_latency_and_lower_throughput():
+    metrics = [
+        Metric("cli_startup", 0.7, "s"),
+        Metric("export_stream_rows", 70_000, "rows/s", higher_is_better=True),
+    ]
+    regressions = compare(metrics, BASELINE, 0.2)
+    assert [r.split(":")[0] for r in regressions] == [
+        "cli_startup",
+        "export_stream_rows",
+    ]
+
+
+def test_compare_ignores_metrics_without_baseline():
+    assert compare([Metric("job_poll_detection", 9.0, "s")], BASELINE, 0.2) == []
+
+
+def test_check_budgets():
+    budgets = {"cli_startup": {"max": 0.75, "unit": "s"}}
+    assert check_budgets([Metric("cli_startup", 0.5, "s")], budgets) == []
+    assert len(check_budgets([Metric("cli_startup", 0.9, "s")], budgets)) == 1
+
+
+@pytest.mark.perf
+def test_cli_startup_within_budget():
+    if shutil.which("splunk-as") is None:
+        pytest.skip("splunk-as not installed")
+
+    metric = bench_startup(dict(os.environ), repeat=3)
+    violations = check_budgets([metric], load_budgets())
+    assert not violations, "\n".join(violations)
+
+
+@pytest.mark.perf
+@pytest.mark.slow
+def test_no_regressions_against_baseline():
+    if shutil.which("splunk-as") is None:
+        pytest.skip("splunk-as not installed")
+    baseline = load_baseline()
+    if baseline is None:
+        pytest.skip("No baseline recorded (make bench-baseline)")
+
+    regressions = compare(run_benchmarks(), baseline, DEFAULT_THRESHOLD)
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,208 @@
+"""Behavior checks for the fake splunkd server used by offline tests."""
+
+import json
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+from fake_splunkd import MAX_DOCUMENTS_PER_BATCH_SAVE, FakeSplunkd
+from fake_splunkd.server import BASE_EPOCH
+
+
+def _request(server, method, path, data=None, headers=None):
+    """Return (status, body bytes) for a request against the fake server."""
+    if isinstance(data, dict):
+        data = urllib.parse.urlencode(data).encode()
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            **(headers or {}),
+        }
+    req = urllib.request.Request(
+        server.url + path, data=data, method=method, headers=headers or {}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _state(server, sid):
+    status, body = _request(server, "GET", f"/services/search/v2/jobs/{sid}")
+    assert status == 200
+    return json.loads(body)["entry"][0]["content"]["dispatchState"]
+
+
+def test_job_runs_then_completes(fake_splunkd):
+    fake_splunkd.state.job_duration = 0.5
+    status, body = _request(
+        fake_splunkd, "POST", "/services/search/v2/jobs", {"search": "index=main"}
+    )
+    assert status == 201
+    sid = json.loads(body)["sid"]
+
+    assert _state(fake_splunkd, sid) == "RUNNING"
+    time.sleep(0.6)
+    assert _state(fake_splunkd, sid) == "DONE"
+
+
+def test_sid_matches_cli_format(fake_splunkd):
+    validators = pytest.importorskip("splunk_as.validators")
+    _, body = _request(
+        fake_splunkd, "POST", "/services/search/v2/jobs", {"search": "index=main"}
+    )
+    sid = json.loads(body)["sid"]
+
+    assert validators.validate_sid(sid) == sid
+    status, _ = _request(fake_splunkd, "GET", f"/services/search/v2/jobs/{sid}")
+    assert status == 200
+
+
+def test_lookup_upload_round_trips_through_oneshot(fake_splunkd):
+    # The SPL splunk-as builds for `lookup upload` and `lookup get`
+    upload = (
+        '| makeresults | eval user="john", email="j@example.com" '
+        '| append [| makeresults | eval user="ann", email="say \\"hi\\""] '
+        '| outputlookup "users.csv"'
+    )
+    path = "/servicesNS/nobody/search/search/jobs/oneshot"
+    status, _ = _request(
+        fake_splunkd, "POST", path, {"search": upload, "output_mode": "json"}
+    )
+    assert status == 200
+
+    status, body = _request(
+        fake_splunkd,
+        "POST",
+        path,
+        {"search": '| inputlookup "users.csv" | head 10', "output_mode": "json"},
+    )
+    assert status == 200
+    assert json.loads(body)["results"] == [
+        {"user": "john", "email": "j@example.com"},
+        {"user": "ann", "email": 'say "hi"'},
+    ]
+
+
+def test_metadata_summarizes_the_window(fake_splunkd):
+    status, body = _request(
+        fake_splunkd,
+        "POST",
+        "/services/search/jobs/oneshot",
+        {
+            "search": "| metadata type=hosts index=main",
+            "earliest_time": str(BASE_EPOCH - 19),
+            "output_mode": "json",
+        },
+    )
+    assert status == 200
+    hosts = json.loads(body)["results"]
+    assert [h["host"] for h in hosts] == [f"web{i:02d}" for i in range(10)]
+    assert {h["totalCount"] for h in hosts} == {"2"}
+    assert hosts[0]["lastTime"] == str(BASE_EPOCH)
+
+
+def test_job_listing_filters_newest_first(fake_splunkd):
+    for search in ("index=a", "index=b", "index=c"):
+        _request(fake_splunkd, "POST", "/services/search/jobs", {"search": search})
+        time.sleep(0.01)
+    first = min(fake_splunkd.state.jobs.values(), key=lambda j: j.created)
+    first.owner = "svc_reports"
+
+    _, body = _request(fake_splunkd, "GET", "/services/search/jobs?count=2")
+    assert [e["name"] for e in json.loads(body)["entry"]] == ["index=c", "index=b"]
+
+    query = urllib.parse.quote("eai:acl.owner=svc_* dispatchState=DONE")
+    _, body = _request(fake_splunkd, "GET", f"/services/search/jobs?search={query}")
+    assert [e["content"]["sid"] for e in json.loads(body)["entry"]] == [first.sid]
+
+
+def test_batch_save_limit(fake_splunkd):
+    _request(
+        fake_splunkd,
+        "POST",
+        "/servicesNS/nobody/search/storage/collections/config",
+        {"name": "hosts"},
+    )
+    path = "/servicesNS/nobody/search/storage/collections/data/hosts/batch_save"
+    headers = {"Content-Type": "application/json"}
+
+    records = [{"host": f"h{i}"} for i in range(MAX_DOCUMENTS_PER_BATCH_SAVE)]
+    status, body = _request(
+        fake_splunkd, "POST", path, json.dumps(records).encode(), headers
+    )
+    assert status == 200
+    assert len(json.loads(body)) == MAX_DOCUMENTS_PER_BATCH_SAVE
+
+    records.append({"host": "one-too-many"})
+    status, _ = _request(
+        fake_splunkd, "POST", path, json.dumps(records).encode(), headers
+    )
+    assert status == 400
+
+
+def test_csv_export_is_chunked_with_single_header(fake_splunkd):
+    fake_splunkd.state.stream_chunk_rows = 7
+    status, body = _request(
+        fake_splunkd,
+        "POST",
+        "/services/search/v2/jobs/export",
+        {"search": "index=main", "output_mode": "csv", "field_list": "_time,host"},
+    )
+    lines = body.decode().splitlines()
+    assert status == 200
+    assert lines[0] == "_time,host"
+    assert lines.count("_time,host") == 1
+    assert len(lines) == fake_splunkd.state.rows + 1
+
+
+def test_export_honors_epoch_window(fake_splunkd):
+    params = {
+        "search": "index=main",
+        "output_mode": "csv",
+        "field_list": "_time",
+        "earliest_time": str(BASE_EPOCH - 20),
+        "latest_time": str(BASE_EPOCH - 10),
+    }
+    _, body = _request(fake_splunkd, "POST", "/services/search/jobs/export", params)
+    times = [int(t) for t in body.decode().splitlines()[1:]]
+    assert times == list(range(BASE_EPOCH - 11, BASE_EPOCH - 21, -1))
+
+
+def test_token_required():
+    with FakeSplunkd(token="secret") as server:
+        status, _ = _request(server, "GET", "/services/server/info")
+        assert status == 401
+        status, _ = _request(
+            server,
+            "GET",
+            "/services/server/info",
+            headers={"Authorization": "Bearer secret"},
+        )
+        assert status == 200
+
+
+def test_invalid_input_is_rejected(fake_splunkd):
+    _request(
+        fake_splunkd, "POST", "/services/storage/collections/config", {"name": "c"}
+    )
+    status, _ = _request(
+        fake_splunkd,
+        "POST",
+        "/services/storage/collections/data/c/batch_save",
+        b"not json",
+        {"Content-Type": "application/json"},
+    )
+    assert status == 400
+
+    status, _ = _request(
+        fake_splunkd, "POST", "/services/search/jobs/oneshot", {"count": "abc"}
+    )
+    assert status == 400
+
+
+def test_env_fixture_points_at_server(fake_splunkd_env):
+    assert os.environ["SPLUNK_MANAGEMENT_PORT"] == str(fake_splunkd_env.port)